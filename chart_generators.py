@@ -4,21 +4,22 @@ import numpy as np
 import math
 from datetime import datetime, timezone, timedelta
 import logging
+from chart_styles import (
+    find_column, prepare_state_map, COLORS, BIVARIATE_COLORS, STATE_CENTROIDS
+)
 
-def create_measles_timeline(timeline_data):
+def create_measles_timeline(timeline_data, refreshed_at=None):
     """
     Creates a timeline chart showing measles cases over time with key vaccine milestones.
     Uses square root scaling to display both historical peaks and recent trends.
 
     Args:
         timeline_data: DataFrame with columns 'Year', 'Cases', optional 'Highlight'
+        refreshed_at: datetime of this run for the footer timestamp (defaults to now)
 
     Returns:
         plotly Figure object
     """
-    import numpy as np
-    import pandas as pd
-    import plotly.graph_objects as go
 
     # Enhanced color palette - organized by temperature and intensity
     colors = {
@@ -76,7 +77,8 @@ def create_measles_timeline(timeline_data):
     # Prepare data
     df["Label_wrapped"] = df.get("Highlight", "").apply(wrap_text)
     has_highlights = df["Label_wrapped"].notna()
-    df['Cases_sqrt'] = np.sqrt(df['Cases'])  # Square root scale for better visibility
+    # Square root scale for better visibility; float32 is plenty for plot positions (hover shows the raw Cases)
+    df['Cases_sqrt'] = np.sqrt(df['Cases'].to_numpy(dtype=np.float32))
 
     fig = go.Figure()
 
@@ -93,10 +95,13 @@ def create_measles_timeline(timeline_data):
     ))
 
     # Vaccine milestones - vertical reference lines with better styling
+    # All three lines span the full data height; reduce it once
+    cases_sqrt_max = np.nanmax(df['Cases_sqrt'].to_numpy())
+
     # 1963 - MMR vaccine licensing
     fig.add_trace(go.Scatter(
         x=[1963, 1963],
-        y=[0, df['Cases_sqrt'].max()],
+        y=[0, cases_sqrt_max],
         mode='lines',
         line=dict(color='black', width=3, dash="solid"),
         name="MMR Vaccine Licensed (1963)",
@@ -107,7 +112,7 @@ def create_measles_timeline(timeline_data):
     # 1989 - Two MMR doses recommendation with improved visual distinction
     fig.add_trace(go.Scatter(
         x=[1989 - 0.2, 1989 - 0.2],
-        y=[0, df['Cases_sqrt'].max()],
+        y=[0, cases_sqrt_max],
         mode='lines',
         line=dict(color='black', width=3, dash="dash"),
         name="Two MMR Doses Recommended (1989)",
@@ -117,7 +122,7 @@ def create_measles_timeline(timeline_data):
 
     fig.add_trace(go.Scatter(
         x=[1989 + 0.2, 1989 + 0.2],
-        y=[0, df['Cases_sqrt'].max()],
+        y=[0, cases_sqrt_max],
         mode='lines',
         line=dict(color='black', width=3, dash="dash"),
         showlegend=False,  # Don't duplicate in legend
@@ -217,7 +222,8 @@ def create_measles_timeline(timeline_data):
         fig.update_layout(annotations=create_annotations(highlight_data))
 
     # Enhanced layout configuration with consistent spacing
-    last_refreshed = datetime.now(timezone(timedelta(hours=-7))).strftime("%B %d, %Y at %I:%M %p MST")
+    refreshed_at = refreshed_at or datetime.now()
+    last_refreshed = refreshed_at.astimezone(timezone(timedelta(hours=-7))).strftime("%B %d, %Y at %I:%M %p MST")
 
     fig.update_layout(
         title=None,
@@ -294,7 +300,7 @@ def create_measles_timeline(timeline_data):
 
     return fig
 
-def create_recent_trends(usmeasles_data, mmr_data):
+def create_recent_trends(usmeasles_data, mmr_data, refreshed_at=None):
     """
     Creates a dual-axis chart showing recent measles cases (bars) and MMR vaccination
     coverage (line) with herd immunity threshold.
@@ -302,12 +308,11 @@ def create_recent_trends(usmeasles_data, mmr_data):
     Args:
         usmeasles_data: DataFrame with columns 'year', 'cases'
         mmr_data: DataFrame with columns 'year', 'Location', 'MMR'
+        refreshed_at: datetime of this run for the footer timestamp (defaults to now)
 
     Returns:
         plotly Figure object
     """
-    import pandas as pd
-    import plotly.graph_objects as go
 
     # Enhanced color palette using your full color scheme
     colors = {
@@ -348,19 +353,20 @@ def create_recent_trends(usmeasles_data, mmr_data):
     if usmeasles_data.empty:
         return go.Figure()
 
-    # Prepare measles data
-    us_data = usmeasles_data.copy()
+    # Prepare measles data - only year, cases and MMR are plotted, so carry just those columns
+    us_data = usmeasles_data[['year', 'cases']].copy()
     us_data['Location'] = 'United States'
     us_data = us_data.drop_duplicates(subset=['year'])
 
     # Merge with vaccination data if available
     if not mmr_data.empty:
-        mmr_clean = mmr_data.copy().drop_duplicates(subset=['year', 'Location'])
-        us_data = pd.merge(us_data, mmr_clean, on=['year', 'Location'], how='left')
+        mmr_clean = mmr_data.loc[:, mmr_data.columns.intersection(['year', 'Location', 'MMR'])]
+        mmr_clean = mmr_clean.drop_duplicates(subset=['year', 'Location'])
+        us_data = pd.merge(us_data, mmr_clean, on=['year', 'Location'], how='left', validate='one_to_one')
 
     # Filter to recent years (2015 onwards) and clean data
-    us_data = us_data[us_data['year'] > 2014].copy()
-    us_data = us_data.drop_duplicates(subset=['year']).sort_values('year').reset_index(drop=True)
+    us_data = us_data[us_data['year'] > 2014]
+    us_data = us_data.drop_duplicates(subset=['year']).sort_values('year', kind='stable', ignore_index=True)
 
     # Convert to numeric and remove invalid data
     numeric_cols = ['year', 'cases']
@@ -384,7 +390,8 @@ def create_recent_trends(usmeasles_data, mmr_data):
         name="Annual Measles Cases",
         marker=dict(color=colors['deep_blue']),
         hovertemplate="<b>Year:</b> %{x}<br><b>Cases:</b> %{y:,}<extra></extra>",
-        text=us_data["cases"],
+        # Labels as whole-number strings, so counts coerced to float64 still read "191", not "191.0"
+        text=us_data["cases"].map('{:.0f}'.format),
         textfont=dict(size=FONT_SIZES['annotation'], family=FONT_FAMILY, color="white"),
         textposition='auto',
         showlegend=True
@@ -418,7 +425,7 @@ def create_recent_trends(usmeasles_data, mmr_data):
             # MMR coverage line (add after so it appears in front)
             fig.add_trace(go.Scatter(
                 x=valid_vaccination["year"],
-                y=valid_vaccination["MMR"],
+                y=valid_vaccination["MMR"].astype(np.float32),
                 name="MMR Vaccination Coverage (%)",
                 mode="lines+markers",
                 line=dict(color=colors['orange'], width=4),
@@ -540,7 +547,8 @@ def create_recent_trends(usmeasles_data, mmr_data):
         )
 
     # Enhanced footer note with proper typography hierarchy
-    last_refreshed = datetime.now(timezone(timedelta(hours=-7))).strftime("%B %d, %Y at %I:%M %p MST")
+    refreshed_at = refreshed_at or datetime.now()
+    last_refreshed = refreshed_at.astimezone(timezone(timedelta(hours=-7))).strftime("%B %d, %Y at %I:%M %p MST")
     fig.add_annotation(
         text=f"<b>Last refreshed:</b> {last_refreshed}",
         xref="paper", yref="paper",
@@ -566,10 +574,6 @@ def create_rnaught_comparison():
     Returns:
         plotly Figure object
     """
-    import numpy as np
-    import pandas as pd
-    import plotly.graph_objects as go
-    import math
 
     # Enhanced color palette using your full color scheme
     colors = {
@@ -613,7 +617,10 @@ def create_rnaught_comparison():
     }
     df = pd.DataFrame(diseases_data)
 
-    fig = go.Figure()
+    # Traces and annotations are collected first and passed to go.Figure once,
+    # rather than re-validating the figure on every add_trace/add_annotation
+    traces = []
+    annotations = []
 
     # Layout parameters for dot plot
     TOTAL_DISEASES = len(df)
@@ -636,21 +643,22 @@ def create_rnaught_comparison():
 
         # Calculate positions for 20 people in circular arrangement
         angles = np.linspace(0, 2 * math.pi, TOTAL_DOTS, endpoint=False)
-        x_coords = cx + CIRCLE_RADIUS * np.cos(angles)
-        y_coords = cy + CIRCLE_RADIUS * np.sin(angles)
-
-        # Add dots representing individual people
-        for j in range(TOTAL_DOTS):
-            if j < r0:  # This person could be infected based on R₀
-                dot_color = INFECTED_COLOR
-                hover_text = f"{disease}: This person could be infected"
-            else:       # This person remains uninfected
-                dot_color = NOT_INFECTED_COLOR
-                hover_text = f"{disease}: This person is not infected"
-
-            fig.add_trace(go.Scatter(
-                x=[x_coords[j]],
-                y=[y_coords[j]],
+        # Rounded to 3 decimals: far below a pixel, and keeps the figure JSON short
+        x_coords = np.round(cx + CIRCLE_RADIUS * np.cos(angles), 3)
+        y_coords = np.round(cy + CIRCLE_RADIUS * np.sin(angles), 3)
+
+        # Add dots representing individual people: one trace per group, since every
+        # dot in a group shares its style and hover text
+        infected = np.arange(TOTAL_DOTS) < r0  # These people could be infected based on R₀
+        for mask, dot_color, hover_text in (
+            (infected, INFECTED_COLOR, f"{disease}: This person could be infected"),
+            (~infected, NOT_INFECTED_COLOR, f"{disease}: This person is not infected"),
+        ):
+            if not mask.any():
+                continue
+            traces.append(go.Scatter(
+                x=x_coords[mask],
+                y=y_coords[mask],
                 mode='markers',
                 marker=dict(
                     size=DOT_SIZE,
@@ -662,7 +670,7 @@ def create_rnaught_comparison():
             ))
 
         # Add central index case (patient zero)
-        fig.add_trace(go.Scatter(
+        traces.append(go.Scatter(
             x=[cx],
             y=[cy],
             mode='markers',
@@ -683,7 +691,7 @@ def create_rnaught_comparison():
                 line_y.extend([cy, y_coords[j], None])
 
         if line_x:
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=line_x,
                 y=line_y,
                 mode='lines',
@@ -694,7 +702,7 @@ def create_rnaught_comparison():
             ))
 
         # Add disease label with R₀ value
-        fig.add_annotation(
+        annotations.append(dict(
             x=cx,
             y=cy - CIRCLE_RADIUS - 1.0,
             text=f"<b>{disease}</b><br>R₀ = {r0}",
@@ -703,7 +711,7 @@ def create_rnaught_comparison():
             yanchor="top",
             font=dict(size=FONT_SIZES['annotation'], color="black", family=FONT_FAMILY),
             align="center"
-        )
+        ))
 
     # Calculate layout bounds for proper display
     x_min = -CIRCLE_RADIUS - 1.0
@@ -711,8 +719,19 @@ def create_rnaught_comparison():
     y_min = Y_POSITION - CIRCLE_RADIUS - 2.5
     y_max = Y_POSITION + CIRCLE_RADIUS + 1.0
 
+    # Add legend explanation with colored dots, left-justified
+    annotations.append(dict(
+        text='Each circle shows 20 people. The orange <span style="color:#fdae61">●</span> dot is the first infected person. Red <span style="color:#d73027">●</span> dots show potential infections (R₀). Grey <span style="color:#d3d3d3">●</span> dots are not infected people.',
+        xref="paper", yref="paper",
+        x=0.0, y=1.15,  # Top left corner
+        xanchor="left", yanchor="top",
+        showarrow=False,
+        font=dict(size=FONT_SIZES['legend'], color="black", family=FONT_FAMILY),
+        align="left"
+    ))
+
     # Enhanced layout configuration with consistent spacing
-    fig.update_layout(
+    layout = dict(
         title=None,
         plot_bgcolor='white',  # Clean white background
         paper_bgcolor='white',
@@ -729,164 +748,51 @@ def create_rnaught_comparison():
             scaleanchor="x",
             scaleratio=1
         ),
-        showlegend=False
+        showlegend=False,
+        annotations=annotations
     )
 
-    # Add legend explanation with colored dots, left-justified
-    fig.add_annotation(
-        text='Each circle shows 20 people. The orange <span style="color:#fdae61">●</span> dot is the first infected person. Red <span style="color:#d73027">●</span> dots show potential infections (R₀). Grey <span style="color:#d3d3d3">●</span> dots are not infected people.',
-        xref="paper", yref="paper",
-        x=0.0, y=1.15,  # Top left corner
-        xanchor="left", yanchor="top",
-        showarrow=False,
-        font=dict(size=FONT_SIZES['legend'], color="black", family=FONT_FAMILY),
-        align="left"
-    )
-    return fig
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
-def create_bivariate_choropleth(usmap_data):
+def create_bivariate_choropleth(usmap_data, refreshed_at=None):
     """
     Creates a bivariate choropleth map showing both MMR coverage and measles case rates
     with improved spacing and properly positioned state abbreviations.
     """
-    import plotly.graph_objects as go
-    import pandas as pd
-    import numpy as np
-    from datetime import datetime
-
-    # Your exact 9-color palette arranged in 3x3 matrix
-    # Rows: Case rate (high to low), Cols: MMR coverage (low to high)
-    # Logical progression from red (concerning) to blue (excellent)
-    bivariate_colors = [
-        ['#d73027', '#f46d43', '#fdae61'],  # High case rate: red → orange-red → orange
-        ['#fee090', '#ffffbf', '#e0f3f8'],  # Medium case rate: light orange → pale yellow → very light blue
-        ['#abd9e9', '#74add1', '#4575b4']   # Low case rate: light blue → medium blue → dark blue
-    ]
-
-    # Gray for missing data
-    missing_color = '#E0E0E0'
-
-    # Category labels for detailed classification
-    category_labels = [
-        ["High Cases, Low Vaccination", "High Cases, Medium Vaccination", "High Cases, High Vaccination"],
-        ["Medium Cases, Low Vaccination", "Medium Cases, Medium Vaccination", "Medium Cases, High Vaccination"],
-        ["Low Cases, Low Vaccination", "Low Cases, Medium Vaccination", "Low Cases, High Vaccination"]
-    ]
-
-    # State population lookup
-    state_populations = {
-        'Alabama': 5108468, 'Alaska': 733406, 'Arizona': 7431344, 'Arkansas': 3067732,
-        'California': 38965193, 'Colorado': 5877610, 'Connecticut': 3617176, 'Delaware': 1031890,
-        'Florida': 23244842, 'Georgia': 11029227, 'Hawaii': 1435138, 'Idaho': 1964726,
-        'Illinois': 12569321, 'Indiana': 6862199, 'Iowa': 3207004, 'Kansas': 2940865,
-        'Kentucky': 4555777, 'Louisiana': 4573749, 'Maine': 1395722, 'Maryland': 6164660,
-        'Massachusetts': 7001399, 'Michigan': 10037261, 'Minnesota': 5757976, 'Mississippi': 2940057,
-        'Missouri': 6196357, 'Montana': 1122069, 'Nebraska': 1988536, 'Nevada': 3194176,
-        'New Hampshire': 1402054, 'New Jersey': 9290841, 'New Mexico': 2114371, 'New York': 19299981,
-        'North Carolina': 10835491, 'North Dakota': 783926, 'Ohio': 11785935, 'Oklahoma': 4019800,
-        'Oregon': 4233358, 'Pennsylvania': 12972008, 'Rhode Island': 1095962, 'South Carolina': 5373555,
-        'South Dakota': 919318, 'Tennessee': 7126489, 'Texas': 30503301, 'Utah': 3417734,
-        'Vermont': 647464, 'Virginia': 8715698, 'Washington': 7812880, 'West Virginia': 1770071,
-        'Wisconsin': 5910955, 'Wyoming': 584057
-    }
 
-    state_abbrev = {
-        'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR', 'California': 'CA',
-        'Colorado': 'CO', 'Connecticut': 'CT', 'Delaware': 'DE', 'Florida': 'FL', 'Georgia': 'GA',
-        'Hawaii': 'HI', 'Idaho': 'ID', 'Illinois': 'IL', 'Indiana': 'IN', 'Iowa': 'IA',
-        'Kansas': 'KS', 'Kentucky': 'KY', 'Louisiana': 'LA', 'Maine': 'ME', 'Maryland': 'MD',
-        'Massachusetts': 'MA', 'Michigan': 'MI', 'Minnesota': 'MN', 'Mississippi': 'MS', 'Missouri': 'MO',
-        'Montana': 'MT', 'Nebraska': 'NE', 'Nevada': 'NV', 'New Hampshire': 'NH', 'New Jersey': 'NJ',
-        'New Mexico': 'NM', 'New York': 'NY', 'North Carolina': 'NC', 'North Dakota': 'ND', 'Ohio': 'OH',
-        'Oklahoma': 'OK', 'Oregon': 'OR', 'Pennsylvania': 'PA', 'Rhode Island': 'RI', 'South Carolina': 'SC',
-        'South Dakota': 'SD', 'Tennessee': 'TN', 'Texas': 'TX', 'Utah': 'UT', 'Vermont': 'VT',
-        'Virginia': 'VA', 'Washington': 'WA', 'West Virginia': 'WV', 'Wisconsin': 'WI', 'Wyoming': 'WY'
-    }
-
-    # Improved state centroid coordinates for better label positioning
-    state_centroids = {
-        'AL': [-86.87, 32.78], 'AK': [-153.31, 64.0], 'AZ': [-111.57, 34.29], 'AR': [-92.37, 34.97],
-        'CA': [-119.42, 36.78], 'CO': [-105.51, 39.06], 'CT': [-72.76, 41.60], 'DE': [-75.50, 39.00],
-        'FL': [-81.69, 27.77], 'GA': [-83.64, 32.99], 'HI': [-157.86, 21.31], 'ID': [-114.58, 43.68],
-        'IL': [-89.37, 40.42], 'IN': [-86.44, 40.30], 'IA': [-93.09, 41.88], 'KS': [-98.58, 38.53],
-        'KY': [-84.27, 37.84], 'LA': [-91.87, 31.17], 'ME': [-69.39, 45.37], 'MD': [-76.59, 39.05],
-        'MA': [-71.72, 42.34], 'MI': [-84.54, 44.18], 'MN': [-93.90, 46.39], 'MS': [-89.87, 32.74],
-        'MO': [-92.28, 38.57], 'MT': [-109.45, 46.92], 'NE': [-99.90, 41.50], 'NV': [-116.94, 39.33],
-        'NH': [-71.56, 43.45], 'NJ': [-74.52, 40.06], 'NM': [-106.24, 34.84], 'NY': [-75.50, 42.94],
-        'NC': [-79.80, 35.63], 'ND': [-100.34, 47.53], 'OH': [-82.77, 40.42], 'OK': [-96.93, 35.56],
-        'OR': [-120.57, 43.98], 'PA': [-77.20, 40.59], 'RI': [-71.51, 41.70], 'SC': [-80.95, 33.91],
-        'SD': [-99.90, 44.35], 'TN': [-86.69, 35.75], 'TX': [-98.77, 31.17], 'UT': [-111.89, 40.15],
-        'VT': [-72.71, 44.04], 'VA': [-78.47, 37.77], 'WA': [-121.75, 47.40], 'WV': [-80.95, 38.49],
-        'WI': [-89.99, 43.78], 'WY': [-107.55, 43.08]
-    }
+    # Palette and state lookups are shared module constants in chart_styles
+    bivariate_colors = BIVARIATE_COLORS
+    missing_color = COLORS['missing_data']
+    state_centroids = STATE_CENTROIDS
 
     if usmap_data.empty:
         return go.Figure()
 
-    df = usmap_data.copy()
+    # Per-state rates and classification are normally prepared once per run
+    df = prepare_state_map(usmap_data)
 
     # Find cases column
-    cases_col = next((c for c in ['cases_calendar_year', 'cases', 'Cases'] if c in df.columns), None)
+    cases_col = find_column(df)
     vaccination_col = 'Estimate (%)'
 
     if cases_col is None or vaccination_col not in df.columns:
         return go.Figure()
 
-    # Prepare data
-    df = df.copy()
-    df['population'] = df['geography'].map(state_populations)
-    df['state_code'] = df['geography'].map(state_abbrev)
-    df['case_rate'] = (df[cases_col] / df['population'] * 100000).round(2).fillna(0)
-    df[vaccination_col] = pd.to_numeric(df[vaccination_col], errors='coerce')
-
-    # Identify states with missing MMR data
-    missing_mmr_states_df = df[df[vaccination_col].isna()].copy()
+    # Identify states with missing MMR data (case_rate is already NaN-free)
+    missing_mask = df[vaccination_col].isna().to_numpy()
+    map_columns = ['geography', 'state_code', 'case_rate', cases_col, 'population']
+    missing_mmr_states_df = df.loc[missing_mask, map_columns]
     missing_mmr_states = missing_mmr_states_df['state_code'].tolist()
 
-    # Remove rows with missing data for the bivariate classification
-    df_clean = df.dropna(subset=[vaccination_col, 'case_rate']).copy()
-
-    def classify_detailed_bivariate(case_rate, mmr_coverage):
-        """Classify states into detailed 3x3 bivariate categories"""
-        # Case rate classification (0=low, 1=medium, 2=high)
-        if case_rate <= 1.0:
-            case_class = 2  # Low cases (bottom row)
-        elif case_rate <= 3.0:
-            case_class = 1  # Medium cases (middle row)
-        else:
-            case_class = 0  # High cases (top row)
-
-        # MMR coverage classification (0=low, 1=medium, 2=high)
-        if mmr_coverage < 92:
-            mmr_class = 0  # Low coverage
-        elif mmr_coverage < 96:
-            mmr_class = 1  # Medium coverage
-        else:
-            mmr_class = 2  # High coverage
-
-        return case_class, mmr_class, category_labels[case_class][mmr_class]
-
-    # Apply detailed bivariate classification
-    classification_results = df_clean.apply(
-        lambda row: classify_detailed_bivariate(row['case_rate'], row[vaccination_col]), axis=1
-    )
-
-    df_clean['case_class'] = [result[0] for result in classification_results]
-    df_clean['mmr_class'] = [result[1] for result in classification_results]
-    df_clean['category_label'] = [result[2] for result in classification_results]
-    df_clean['color'] = [bivariate_colors[result[0]][result[1]] for result in classification_results]
-
-    # Add color to main df for state abbreviation text color determination
-    df = df.merge(df_clean[['state_code', 'color']], on='state_code', how='left')
-    df['color'] = df['color'].fillna(missing_color)
+    # Classified states, carrying only the columns the traces read
+    df_clean = df.loc[~missing_mask, map_columns + [vaccination_col, 'case_class', 'mmr_class', 'category_label']]
 
     fig = go.Figure()
 
     # Add traces for states with missing MMR data first (grey)
     if not missing_mmr_states_df.empty:
         fig.add_trace(go.Choropleth(
-            locations=missing_mmr_states_df['state_code'],
+            locations=missing_mmr_states_df['state_code'].to_numpy(),
             z=[1] * len(missing_mmr_states_df),
             locationmode='USA-states',
             marker_line_color='white',
@@ -918,7 +824,7 @@ def create_bivariate_choropleth(usmap_data):
 
             if len(subset) > 0:
                 fig.add_trace(go.Choropleth(
-                    locations=subset['state_code'],
+                    locations=subset['state_code'].to_numpy(),
                     z=[1] * len(subset),
                     locationmode='USA-states',
                     marker_line_color='white',
@@ -1114,8 +1020,10 @@ def create_bivariate_choropleth(usmap_data):
         ))
 
     # Add timestamp and notes positioned at the bottom for full screen
+    refreshed_at = refreshed_at or datetime.now()
+    last_refreshed = refreshed_at.astimezone(timezone(timedelta(hours=-7))).strftime('%B %d, %Y at %I:%M %p MST')
     fig.add_annotation(
-         text=(f"<b>Last refreshed:</b> {datetime.now(timezone(timedelta(hours=-7))).strftime('%B %d, %Y at %I:%M %p MST')}<br>"
+         text=(f"<b>Last refreshed:</b> {last_refreshed}<br>"
               "<i>Note: Grey states are missing vaccination coverage data from the 2024-2025 school year</i>"),
         xref="paper", yref="paper",
         x=0.02, y=0.02,  # Position at bottom left for full screen
@@ -1127,16 +1035,11 @@ def create_bivariate_choropleth(usmap_data):
 
     return fig
     
-def create_lives_saved_chart(vaccine_impact_data):
+def create_lives_saved_chart(vaccine_impact_data, refreshed_at=None):
     """
     Create bar chart visualization of estimated lives saved by vaccination programs
     with discrete color bins and clean styling.
     """
-    import plotly.graph_objects as go
-    import pandas as pd
-    import numpy as np
-    from datetime import datetime
-    import math
 
     color_palette = [
         '#d73027', '#fc8d59', '#fee090', '#ffffbf', '#e0f3f8', '#91bfdb', '#4575b4'
@@ -1167,8 +1070,9 @@ def create_lives_saved_chart(vaccine_impact_data):
     # Define custom bins with increments of 200
     increment = 200
 
-    min_val = df[lives_saved_col].min()
-    max_val = df[lives_saved_col].max()
+    lives_saved_values = df[lives_saved_col].to_numpy(dtype=float)
+    min_val = np.nanmin(lives_saved_values)
+    max_val = np.nanmax(lives_saved_values)
 
     # Create bins with the specified increment
     # Start from a multiple of increment below min_val
@@ -1203,9 +1107,9 @@ def create_lives_saved_chart(vaccine_impact_data):
     for i in range(len(custom_bins) - 1):
         lower_bound = custom_bins[i]
         upper_bound = custom_bins[i+1]
-        if i == 0 and lower_bound == df[lives_saved_col].min():
+        if i == 0 and lower_bound == min_val:
              label = f"≤{upper_bound:,.0f}"
-        elif i == len(custom_bins) - 2 and upper_bound == df[lives_saved_col].max():
+        elif i == len(custom_bins) - 2 and upper_bound == max_val:
              label = f"≥{lower_bound:,.0f}"
         else:
             label = f"{lower_bound:,.0f}-{upper_bound:,.0f}"
@@ -1213,8 +1117,11 @@ def create_lives_saved_chart(vaccine_impact_data):
 
     # Assign each data point to a bin
     df['bin_index'] = pd.cut(df[lives_saved_col], bins=custom_bins, labels=False, include_lowest=True)
-    df['color'] = df['bin_index'].map(lambda x: bin_colors[int(x)] if pd.notna(x) and int(x) < len(bin_colors) else bin_colors[0])
-    df['bin_label'] = df['bin_index'].map(lambda x: bin_labels[int(x)] if pd.notna(x) and int(x) < len(bin_labels) else bin_labels[0])
+    # Look colors and labels up by bin index in one array operation; unbinned values use the first bin
+    bin_index = df['bin_index'].to_numpy(dtype=float)
+    lookup = np.where(np.isnan(bin_index) | (bin_index >= len(bin_colors)), 0, bin_index).astype(int)
+    df['color'] = np.asarray(bin_colors, dtype=object)[lookup]
+    df['bin_label'] = np.asarray(bin_labels, dtype=object)[lookup]
 
     # Font sizing system matching the second function
     FONT_SIZES = {
@@ -1241,7 +1148,7 @@ def create_lives_saved_chart(vaccine_impact_data):
     # Create bars with discrete colors
     fig.add_trace(go.Bar(
         x=df[year_col],
-        y=df[lives_saved_col],
+        y=df[lives_saved_col].astype(np.float32),
         marker=dict(
             color=df['color'],
             line=dict(color='white', width=0.5)
@@ -1343,9 +1250,10 @@ def create_lives_saved_chart(vaccine_impact_data):
         current_x = label_x_position + estimated_label_width_paper_units + spacing
 
     # Add footer with proper spacing matching the second function
-    last_refreshed = datetime.now(timezone(timedelta(hours=-7))).strftime('%B %d, %Y at %I:%M %p MST')
+    refreshed_at = refreshed_at or datetime.now()
+    last_refreshed = refreshed_at.astimezone(timezone(timedelta(hours=-7))).strftime('%B %d, %Y at %I:%M %p MST')
     fig.add_annotation(
-          text=(f"<b>Last refreshed:</b> {datetime.now(timezone(timedelta(hours=-7))).strftime('%B %d, %Y at %I:%M %p MST')}<br>"
+          text=(f"<b>Last refreshed:</b> {last_refreshed}<br>"
               "<i>Note: These are mathematical model estimates, not observed deaths</i>"),
         xref="paper", yref="paper",
         x=0.0, y=SPACING['footer_y'],
@@ -1358,16 +1266,14 @@ def create_lives_saved_chart(vaccine_impact_data):
     return fig
 
 
-def create_southwest_weekly_comparison(weekly_data):
+def create_southwest_weekly_comparison(weekly_data, refreshed_at=None):
     """
     Creates a comparison table of Southwest states' measles cases.
     
     Args:
         weekly_data: Dictionary with 'current' (fresh CDC data) and 'previous' (historical) DataFrames
+        refreshed_at: datetime of this run for the footer timestamp (defaults to now)
     """
-    import plotly.graph_objects as go
-    import pandas as pd
-    from datetime import datetime, timedelta
     
     # State health department URLs for reference
     state_urls = {
@@ -1413,7 +1319,8 @@ def create_southwest_weekly_comparison(weekly_data):
         return fig
     
     # Calculate week start dates
-    current_week_start = datetime.now() - timedelta(days=datetime.now().weekday())
+    refreshed_at = refreshed_at or datetime.now()
+    current_week_start = refreshed_at - timedelta(days=refreshed_at.weekday())
     current_week_str = current_week_start.strftime('%m/%d/%y')
     
     if not previous_df.empty:
@@ -1542,7 +1449,7 @@ def create_southwest_weekly_comparison(weekly_data):
     )])
     
     # Update layout
-    last_refreshed = datetime.now(timezone(timedelta(hours=-7))).strftime('%B %d, %Y at %I:%M %p MST')
+    last_refreshed = refreshed_at.astimezone(timezone(timedelta(hours=-7))).strftime('%B %d, %Y at %I:%M %p MST')
     
     fig.update_layout(
         title=None,
@@ -4,6 +4,9 @@ Provides consistent styling across all visualizations
 """
 
 from datetime import datetime
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 
 # Enhanced color palette using the original scheme
 COLORS = {
@@ -61,6 +64,10 @@ BIVARIATE_LABELS = [
     ["Low Cases, Low Vaccination", "Low Cases, Medium Vaccination", "Low Cases, High Vaccination"]
 ]
 
+# The 3x3 grids flattened row-major, so prepare_state_map can index them with case_class * 3 + mmr_class
+_FLAT_LABELS = np.array(BIVARIATE_LABELS, dtype=object).ravel()
+_FLAT_COLORS = np.array(BIVARIATE_COLORS, dtype=object).ravel()
+
 # State population data
 STATE_POPULATIONS = {
     'Alabama': 5108468, 'Alaska': 733406, 'Arizona': 7431344, 'Arkansas': 3067732,
@@ -92,6 +99,9 @@ STATE_ABBREVIATIONS = {
     'Virginia': 'VA', 'Washington': 'WA', 'West Virginia': 'WV', 'Wisconsin': 'WI', 'Wyoming': 'WY'
 }
 
+# Population and abbreviation indexed by state name, so both attach in one join
+STATE_INFO = pd.DataFrame({'population': STATE_POPULATIONS, 'state_code': STATE_ABBREVIATIONS})
+
 # State centroids for map labels
 STATE_CENTROIDS = {
     'AL': [-86.87, 32.78], 'AK': [-153.31, 64.0], 'AZ': [-111.57, 34.29], 'AR': [-92.37, 34.97],
@@ -251,8 +261,6 @@ def classify_bivariate(case_rate, mmr_coverage):
     Returns:
         tuple: (case_class, mmr_class, category_label, color)
     """
-    import pandas as pd
-    
     if pd.isna(case_rate) or pd.isna(mmr_coverage):
         return None, None, "Missing Data", COLORS['missing_data']
     
@@ -312,8 +320,6 @@ def format_number(value, format_type='comma'):
     Returns:
         str: Formatted number string
     """
-    import pandas as pd
-    
     if pd.isna(value):
         return ''
     
@@ -330,3 +336,72 @@ def format_number(value, format_type='comma'):
         return f"{value:.1f}%"
     else:
         return str(value)
+
+
+# Column names the CDC feeds have used for case counts, in order of preference
+CASES_COLUMNS = ('cases_calendar_year', 'cases', 'Cases')
+
+@lru_cache(maxsize=64)
+def _first_present(columns, candidates):
+    """Return the first of candidates found in columns (both tuples), or None"""
+    present = set(columns)
+    return next((c for c in candidates if c in present), None)
+
+def find_column(df, candidates=CASES_COLUMNS, default=None):
+    """
+    Find the first candidate column present in a DataFrame
+    
+    Lookups are memoized on the column names, so repeated calls for frames
+    with the same layout don't rescan the columns.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to search
+        candidates (tuple): Column names in order of preference (defaults to case count columns)
+        default: Value returned when no candidate is present
+        
+    Returns:
+        str: Matching column name, or default
+    """
+    found = _first_present(tuple(df.columns), tuple(candidates))
+    return default if found is None else found
+
+def prepare_state_map(usmap_data):
+    """
+    Add the per-state columns shared by the state map chart and table
+    
+    Adds population, state_code, case_rate (per 100K, rounded to 2 places) and
+    the bivariate classification (case_class, mmr_class, category_label, color),
+    with 'Estimate (%)' coerced to numeric. Classification matches
+    classify_bivariate, vectorized over the frame. Frames that are already
+    prepared, or lack a cases or coverage column, are returned unchanged.
+    
+    Args:
+        usmap_data (pd.DataFrame): State-level cases and MMR coverage
+        
+    Returns:
+        pd.DataFrame: Prepared frame
+    """
+    cases_col = find_column(usmap_data)
+    if 'category_label' in usmap_data.columns or cases_col is None or 'Estimate (%)' not in usmap_data.columns:
+        return usmap_data
+    
+    df = usmap_data.join(STATE_INFO, on='geography')
+    # Plain NumPy arithmetic; the columns already share an index, so there is nothing to align
+    cases = df[cases_col].to_numpy(dtype=float, na_value=np.nan)
+    population = df['population'].to_numpy(dtype=float, na_value=np.nan)
+    case_rate = np.nan_to_num(np.round(cases / population * 100000, 2), nan=0.0)
+    df['case_rate'] = case_rate
+    df['Estimate (%)'] = pd.to_numeric(df['Estimate (%)'], errors='coerce')
+    
+    coverage = df['Estimate (%)'].to_numpy(dtype=float)
+    case_class = np.where(case_rate <= 1.0, 2, np.where(case_rate <= 3.0, 1, 0))
+    mmr_class = np.where(coverage < 92, 0, np.where(coverage < 96, 1, 2))
+    missing = np.isnan(coverage)  # case_rate is already NaN-free
+    
+    df['case_class'] = pd.array(case_class, dtype='Int8')
+    df['mmr_class'] = pd.array(mmr_class, dtype='Int8')
+    df.loc[missing, ['case_class', 'mmr_class']] = pd.NA
+    grid_index = case_class * 3 + mmr_class  # row-major position in the 3x3 grid
+    df['category_label'] = np.where(missing, 'Missing Data', _FLAT_LABELS[grid_index])
+    df['color'] = np.where(missing, COLORS['missing_data'], _FLAT_COLORS[grid_index])
+    return df
@@ -4,16 +4,59 @@ import json
 import os
 from datetime import datetime
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
+from chart_styles import find_column
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def json_loads(content):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def json_dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 class DataManager:
     # Outbreak tracking constants
     OUTBREAK_START_YEAR = 2025  # The year the current measles outbreak began
     
+    # Declared text columns for the static CSVs so pandas skips inferring them. Numeric
+    # columns are left to inference and coerced later (standardize_year_columns,
+    # merge_timeline_data, process_data), so a blank or malformed cell becomes NaN
+    # instead of failing the whole parse
+    STATIC_DTYPES = {
+        'timeline': {'Highlight': 'str', 'Source': 'str'},
+        'mmr': {'Vaccine': 'str', 'Location': 'str'},
+        'mmr_map': {'Geography': 'str'}
+    }
+    
+    # Columns each processed dataset must provide for the charts and tables
+    REQUIRED_COLUMNS = {
+        'timeline': ['Year', 'Cases'],
+        'usmeasles': ['year', 'cases'],
+        'mmr': ['year', 'MMR'],
+        'usmap': ['geography', 'Estimate (%)'],
+        'vaccine_impact': ['year', 'lives_saved', 'lives_saved_ub', 'lives_saved_lb']
+    }
+    
+    # Plausible year range; lets year columns be stored as 16-bit integers
+    YEAR_RANGE = (1900, 2100)
+    
     def __init__(self, data_dir="data", backup_dir="data/backups"):
         """
         Initialize DataManager with data and backup directories
@@ -40,6 +83,11 @@ class DataManager:
             'timeline_dynamic': 'https://www.cdc.gov/wcms/vizdata/measles/MeaslesCasesHistory.json'  # For 2026 data
         }
         
+        # Shared HTTP session so downloads reuse pooled keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount('https://', adapter)
+        
         # Static data file paths (stored in repo)
         self.static_files = {
             'timeline': 'data/timeline.csv',
@@ -49,36 +97,122 @@ class DataManager:
         
         # Weekly tracking file
         self.weekly_history_file = self.weekly_dir / 'weekly_history.json'
+        self._weekly_history_cache = None
+        self._weekly_history_mtime = None
+        
+        # Parsed static CSVs keyed by path, as (mtime, DataFrame)
+        self._static_cache = {}
+        
+        # HTTP validators (ETag/Last-Modified) per URL for conditional downloads
+        self.http_cache_file = self.backup_dir / '_http_cache.json'
+        self.http_cache = self.load_http_cache()
+        self.force_refresh = os.environ.get('FORCE_REFRESH', 'false').lower() == 'true'
         
         logging.info(f"DataManager initialized")
         logging.info(f"Tracking outbreak starting from year: {self.OUTBREAK_START_YEAR}")
         logging.info(f"Weekly history file path: {self.weekly_history_file.absolute()}")
 
-    def download_data(self, url, timeout=30):
+    def load_http_cache(self):
+        """
+        Load stored HTTP validators used for conditional downloads
+        
+        Returns:
+            dict: Mapping of URL to its last seen 'etag'/'last_modified' values
+        """
+        if not self.http_cache_file.exists():
+            return {}
+        
+        try:
+            with open(self.http_cache_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning(f"Failed to load HTTP cache {self.http_cache_file}: {e}")
+            return {}
+
+    def save_http_cache(self):
+        """Persist HTTP validators collected during this run"""
+        try:
+            with open(self.http_cache_file, 'w') as f:
+                json.dump(self.http_cache, f, indent=2)
+        except Exception as e:
+            logging.error(f"Failed to save HTTP cache {self.http_cache_file}: {e}")
+
+    def record_validators(self, key, validators, backed_up):
+        """
+        Remember a source's HTTP validators once its payload is safely backed up
+        
+        A 304 is answered from the latest backup, so validators are only
+        recorded when that backup holds this payload; otherwise the previous
+        validators, which still describe the previous backup, are kept.
+        
+        Args:
+            key (str): Data source name
+            validators (dict): 'etag'/'last_modified' values, or None to keep the old ones
+            backed_up (bool): Whether the payload's backup was written
+        """
+        if validators and backed_up:
+            self.http_cache[self.data_sources[key]] = validators
+
+    def download_data(self, url, timeout=30, key=None):
         """
         Download data from URL with error handling
         
+        When a backup key is given, the request is made conditional on the
+        ETag/Last-Modified seen last time; a 304 response returns the most
+        recent backup instead of re-downloading and re-parsing the payload.
+        
+        The validators of a fresh response are returned rather than stored, so
+        the caller can record them only once the payload's backup is written.
+        
         Args:
             url (str): URL to download from
             timeout (int): Request timeout in seconds
+            key (str): Optional backup name to serve on 304 Not Modified
             
         Returns:
-            dict or pd.DataFrame: Downloaded data
+            tuple: (data, validators) - the downloaded dict or pd.DataFrame (None on
+                failure), and the response's 'etag'/'last_modified' values (None
+                unless a fresh payload was parsed)
         """
         try:
-            response = requests.get(url, timeout=timeout)
+            headers = {}
+            validators = self.http_cache.get(url, {})
+            if key and not self.force_refresh:
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+            
+            response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+            
+            if response.status_code == 304:
+                logging.info(f"Not modified since last download: {key}")
+                response.close()
+                backup_data = self.load_backup(key)
+                if backup_data is not None:
+                    return backup_data, None
+                # No backup to serve - fetch the full payload instead
+                response = self.session.get(url, timeout=timeout, stream=True)
+            
             response.raise_for_status()
             
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            
             if url.endswith('.json'):
-                return response.json()
+                return json_loads(response.content), validators
             else:
-                # For CSV files
-                from io import StringIO
-                return pd.read_csv(StringIO(response.text))
+                # For CSV files - stream the body straight into the parser
+                response.raw.decode_content = True
+                return pd.read_csv(response.raw), validators
                 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError,
+                ValueError, pd.errors.ParserError) as e:
+            # ValueError covers a truncated or non-JSON body (orjson/json decode errors)
             logging.error(f"Failed to download data from {url}: {e}")
-            return None
+            return None, None
 
     def save_backup(self, data, filename):
         """
@@ -87,6 +221,9 @@ class DataManager:
         Args:
             data: Data to save
             filename (str): Base filename for backup
+            
+        Returns:
+            bool: True if the backup was written
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_filename = f"{filename}_{timestamp}"
@@ -101,11 +238,18 @@ class DataManager:
                 backup_path = backup_path.with_suffix('.json')
                 with open(backup_path, 'w') as f:
                     json.dump(data, f, indent=2)
+            
+            # Point <filename>.latest at this backup; replace() keeps the update atomic
+            pointer_tmp = self.backup_dir / f"{filename}.latest.tmp"
+            pointer_tmp.write_text(backup_path.name)
+            os.replace(pointer_tmp, self.backup_dir / f"{filename}.latest")
                     
             logging.info(f"Backup saved: {backup_path}")
+            return True
             
         except Exception as e:
             logging.error(f"Failed to save backup {backup_filename}: {e}")
+            return False
 
     def load_backup(self, filename):
         """
@@ -117,15 +261,24 @@ class DataManager:
         Returns:
             Data from backup file or None if not found
         """
-        # Find most recent backup
-        backup_files = list(self.backup_dir.glob(f"{filename}_*"))
-        
-        if not backup_files:
-            logging.warning(f"No backup found for {filename}")
-            return None
-            
-        # Sort by modification time, get most recent
-        most_recent = max(backup_files, key=lambda f: f.stat().st_mtime)
+        # Follow the pointer written by save_backup when it is still valid
+        most_recent = None
+        pointer_file = self.backup_dir / f"{filename}.latest"
+        if pointer_file.exists():
+            candidate = self.backup_dir / pointer_file.read_text().strip()
+            if candidate.is_file():
+                most_recent = candidate
+        
+        if most_recent is None:
+            # Fall back to scanning for the most recent backup
+            backup_files = list(self.backup_dir.glob(f"{filename}_*"))
+            
+            if not backup_files:
+                logging.warning(f"No backup found for {filename}")
+                return None
+                
+            # Sort by modification time, get most recent
+            most_recent = max(backup_files, key=lambda f: f.stat().st_mtime)
         
         try:
             if most_recent.suffix == '.csv':
@@ -141,12 +294,13 @@ class DataManager:
             logging.error(f"Failed to load backup {most_recent}: {e}")
             return None
 
-    def load_static_data(self, filename):
+    def load_static_data(self, filename, dtype=None):
         """
         Load static data file from repository
         
         Args:
             filename (str): Path to static data file
+            dtype (dict): Optional column types for CSV files
             
         Returns:
             pd.DataFrame: Loaded data
@@ -154,7 +308,15 @@ class DataManager:
         try:
             filepath = Path(filename)
             if filepath.suffix == '.csv':
-                return pd.read_csv(filepath)
+                # Reuse the parsed frame while the file is unchanged; callers get their own copy
+                mtime = filepath.stat().st_mtime
+                cached = self._static_cache.get(str(filepath))
+                if cached is not None and cached[0] == mtime:
+                    return cached[1].copy()
+                
+                data = pd.read_csv(filepath, dtype=dtype)
+                self._static_cache[str(filepath)] = (mtime, data)
+                return data.copy()
             else:
                 with open(filepath, 'r') as f:
                     return json.load(f)
@@ -177,8 +339,10 @@ class DataManager:
         if year_col in df.columns:
             # Convert to numeric, handling any string representations
             df[year_col] = pd.to_numeric(df[year_col], errors='coerce')
-            # Convert to integer where possible
-            df[year_col] = df[year_col].astype('Int64')  # Nullable integer
+            # Drop out-of-range values, then store as a compact nullable integer
+            min_year, max_year = self.YEAR_RANGE
+            df[year_col] = df[year_col].where(df[year_col].between(min_year, max_year))
+            df[year_col] = df[year_col].astype('Int16')
         return df
 
     def merge_timeline_data(self, static_timeline, dynamic_2026_data):
@@ -261,7 +425,14 @@ class DataManager:
         
         if self.weekly_history_file.exists():
             try:
-                file_size = self.weekly_history_file.stat().st_size
+                file_stat = self.weekly_history_file.stat()
+                
+                # Reuse the parsed history if the file hasn't changed since the last read
+                if self._weekly_history_cache is not None and file_stat.st_mtime == self._weekly_history_mtime:
+                    logging.info(f"Using cached weekly history ({len(self._weekly_history_cache)} week entries)")
+                    return list(self._weekly_history_cache)
+                
+                file_size = file_stat.st_size
                 logging.info(f"File size: {file_size} bytes")
                 
                 with open(self.weekly_history_file, 'r') as f:
@@ -272,17 +443,25 @@ class DataManager:
                         logging.warning("Weekly history file is empty")
                         return []
                     
-                    data = json.loads(content)
+                    data = json_loads(content)
+                    if isinstance(data, dict):
+                        # History is keyed by week ('%Y-W%U'), which sorts chronologically
+                        weeks = data.get('weeks', {})
+                        data = [weeks[week_key] for week_key in sorted(weeks)]
                     logging.info(f"Successfully parsed JSON with {len(data)} week entries")
                     
                     # Log details about the weeks
                     for i, week_entry in enumerate(data):
+                        week_entry['data'] = self.snapshot_columns(week_entry)
                         week = week_entry.get('week', 'unknown')
                         date = week_entry.get('date', 'unknown')
-                        num_states = len(week_entry.get('data', []))
-                        logging.info(f"  Week {i+1}: {week} ({date}) with {num_states} states")
+                        num_states = len(week_entry['data']['State'])
+                        total_cases = sum(week_entry['data']['Cases'])
+                        logging.info(f"  Week {i+1}: {week} ({date}) with {num_states} states, {total_cases} total cases")
                     
-                    return data
+                    self._weekly_history_cache = data
+                    self._weekly_history_mtime = file_stat.st_mtime
+                    return list(data)
                     
             except json.JSONDecodeError as e:
                 logging.error(f"Failed to parse JSON in weekly history: {e}")
@@ -302,6 +481,45 @@ class DataManager:
         
         return []
 
+    @staticmethod
+    def snapshot_columns(snapshot):
+        """
+        Get a weekly snapshot's state data in column-oriented form
+        
+        Args:
+            snapshot (dict): Weekly history entry
+            
+        Returns:
+            dict: {'State': [...], 'Cases': [...]} lists of equal length
+        """
+        data = snapshot.get('data', {})
+        if isinstance(data, list):
+            # Older snapshots stored one {'State': ..., 'Cases': ...} record per state
+            return {
+                'State': [row.get('State') for row in data],
+                'Cases': [row.get('Cases', 0) for row in data]
+            }
+        return data
+
+    @staticmethod
+    def week_key(moment):
+        """
+        Build the weekly history key for a date, e.g. '2026-W23'
+        
+        Weeks start on Sunday and days before the year's first Sunday fall in
+        week 00, matching strftime('%Y-W%U') used by existing history files.
+        
+        Args:
+            moment (datetime): Date to get the week for
+            
+        Returns:
+            str: Week key
+        """
+        day_of_year = moment.toordinal() - moment.replace(month=1, day=1).toordinal()
+        days_since_sunday = (moment.weekday() + 1) % 7
+        week = (day_of_year + 7 - days_since_sunday) // 7
+        return f"{moment.year}-W{week:02d}"
+
     def save_weekly_snapshot(self, state_data):
         """
         Save current week's state case data to history
@@ -310,41 +528,37 @@ class DataManager:
             state_data: DataFrame with State and Cases columns
         """
         try:
-            history = self.load_weekly_history()
-            
-            current_week = datetime.now().strftime('%Y-W%U')
+            weeks = {snapshot.get('week'): snapshot for snapshot in self.load_weekly_history()}
             
-            # Check if we already have data for this week
-            existing_week_index = None
-            for i, snapshot in enumerate(history):
-                if snapshot.get('week') == current_week:
-                    existing_week_index = i
-                    break
+            now = datetime.now()
+            current_week = self.week_key(now)
             
             snapshot = {
-                'date': datetime.now().strftime('%Y-%m-%d'),
+                'date': now.date().isoformat(),
                 'week': current_week,
-                'data': state_data[['State', 'Cases']].to_dict('records')
+                'data': {
+                    'State': state_data['State'].tolist(),
+                    'Cases': state_data['Cases'].tolist()
+                }
             }
             
-            if existing_week_index is not None:
-                # Update existing week's data
-                history[existing_week_index] = snapshot
+            if current_week in weeks:
                 logging.info(f"Updated weekly snapshot for {current_week}")
             else:
-                # Add new week's data
-                history.append(snapshot)
                 logging.info(f"Added new weekly snapshot for {current_week}")
+            weeks[current_week] = snapshot
             
             # Keep only last 8 weeks of history
-            if len(history) > 8:
-                history = history[-8:]
+            history = {'weeks': {week_key: weeks[week_key] for week_key in sorted(weeks)[-8:]}}
             
             # Ensure directory exists
             self.weekly_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(self.weekly_history_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            with open(self.weekly_history_file, 'wb') as f:
+                f.write(json_dumps(history))
+            
+            # Invalidate the in-memory copy so the next load re-reads the file
+            self._weekly_history_cache = None
             
             logging.info(f"Successfully saved weekly history to {self.weekly_history_file.absolute()}")
             logging.info(f"File size after save: {self.weekly_history_file.stat().st_size} bytes")
@@ -373,12 +587,12 @@ class DataManager:
             return result
         
         if len(history) >= 1:
-            result['current'] = pd.DataFrame(history[-1]['data'])
-            logging.info(f"Loaded current week data from {history[-1]['week']} ({len(history[-1]['data'])} states)")
+            result['current'] = pd.DataFrame(self.snapshot_columns(history[-1]))
+            logging.info(f"Loaded current week data from {history[-1]['week']} ({len(result['current'])} states)")
         
         if len(history) >= 2:
-            result['previous'] = pd.DataFrame(history[-2]['data'])
-            logging.info(f"Loaded previous week data from {history[-2]['week']} ({len(history[-2]['data'])} states)")
+            result['previous'] = pd.DataFrame(self.snapshot_columns(history[-2]))
+            logging.info(f"Loaded previous week data from {history[-2]['week']} ({len(result['previous'])} states)")
         else:
             logging.warning("No previous week data available yet")
         
@@ -423,10 +637,10 @@ class DataManager:
                 state_data.rename(columns={'geography': 'State'}, inplace=True)
             
             # Find and rename the cases column
-            cases_col = next((c for c in ['cases_calendar_year', 'cases', 'Cases'] if c in state_data.columns), None)
+            cases_col = find_column(state_data)
             if cases_col:
                 state_data.rename(columns={cases_col: 'Cases'}, inplace=True)
-                state_data['Cases'] = pd.to_numeric(state_data['Cases'], errors='coerce').fillna(0).astype(int)
+                state_data['Cases'] = pd.to_numeric(state_data['Cases'], errors='coerce').fillna(0).astype('int32')
             
             # Filter out non-states
             state_data = state_data[~state_data['State'].isin(['New York City', 'District of Columbia'])].copy()
@@ -468,7 +682,7 @@ class DataManager:
         
         # Load static files
         for key, filepath in self.static_files.items():
-            static_data = self.load_static_data(filepath)
+            static_data = self.load_static_data(filepath, dtype=self.STATIC_DTYPES.get(key))
             if static_data is not None:
                 # Standardize year columns if they exist
                 if key == 'mmr' and 'year' in static_data.columns:
@@ -479,13 +693,19 @@ class DataManager:
                 logging.error(f"Failed to load static data: {key}")
                 return None
         
-        # Download dynamic data with backup fallback
-        for key, url in self.data_sources.items():
+        # Download all dynamic sources concurrently - they are independent and network-bound
+        with ThreadPoolExecutor(max_workers=len(self.data_sources)) as executor:
+            futures = {key: executor.submit(self.download_data, url, key=key)
+                       for key, url in self.data_sources.items()}
+            downloads = {key: future.result() for key, future in futures.items()}
+        
+        # Process downloaded data with backup fallback
+        for key in self.data_sources:
             # Skip timeline_dynamic here - it will be handled separately
             if key == 'timeline_dynamic':
                 continue
                 
-            downloaded_data = self.download_data(url)
+            downloaded_data, validators = downloads[key]
             
             if downloaded_data is not None:
                 # Convert to DataFrame - handle both dict and list formats from JSON APIs
@@ -497,7 +717,7 @@ class DataManager:
                     downloaded_data = self.standardize_year_columns(downloaded_data, 'year')
                     
                 data[key] = downloaded_data
-                self.save_backup(downloaded_data, key)
+                self.record_validators(key, validators, self.save_backup(downloaded_data, key))
                 logging.info(f"Downloaded fresh data: {key}")
                 
             else:
@@ -518,8 +738,8 @@ class DataManager:
                     return None
 
         # **NEW: Fetch dynamic 2026 timeline data**
-        logging.info("Attempting to fetch dynamic 2026 timeline data from CDC API...")
-        dynamic_timeline = self.download_data(self.data_sources['timeline_dynamic'])
+        logging.info("Processing dynamic 2026 timeline data from CDC API...")
+        dynamic_timeline, validators = downloads['timeline_dynamic']
         
         if dynamic_timeline is not None:
             if isinstance(dynamic_timeline, (dict, list)):
@@ -530,11 +750,14 @@ class DataManager:
             
             logging.info(f"Successfully downloaded dynamic 2026 timeline data")
             # Save backup of dynamic data
-            self.save_backup(dynamic_timeline, 'timeline_dynamic')
+            self.record_validators('timeline_dynamic', validators, self.save_backup(dynamic_timeline, 'timeline_dynamic'))
         else:
             logging.warning("Failed to download dynamic 2026 timeline data - will use static data only")
             dynamic_timeline = None
 
+        # Validators are only recorded for payloads that parsed and were backed up
+        self.save_http_cache()
+        
         # Process and merge data
         processed_data = self.process_data(data, dynamic_timeline)
         return processed_data
@@ -552,9 +775,11 @@ class DataManager:
         """
         processed = {}
         
+        # raw_data is not used again after processing, so its frames are
+        # cleaned in place rather than copied first
         try:
             # Timeline data - merge static with dynamic 2026 data
-            timeline = raw_data['timeline'].copy()
+            timeline = raw_data['timeline']
             if 'Year' in timeline.columns:
                 timeline['Year'] = pd.to_numeric(timeline['Year'], errors='coerce')
             
@@ -568,14 +793,14 @@ class DataManager:
             logging.info("Processed timeline data successfully")
             
             # US Measles data - ensure year is numeric
-            usmeasles = raw_data['usmeasles'].copy()
+            usmeasles = raw_data['usmeasles']
             if 'year' in usmeasles.columns:
                 usmeasles = self.standardize_year_columns(usmeasles, 'year')
             processed['usmeasles'] = usmeasles
             logging.info("Processed US measles data successfully")
             
             # MMR Coverage data - ensure year is numeric
-            mmr = raw_data['mmr'].copy()
+            mmr = raw_data['mmr']
             if 'year' in mmr.columns:
                 mmr = self.standardize_year_columns(mmr, 'year')
             processed['mmr'] = mmr
@@ -584,7 +809,7 @@ class DataManager:
             # Process map data with proper data type handling
             logging.info("Processing map data...")
             mmr_map = raw_data['mmr_map'].rename(columns={'Geography': 'geography'})
-            usmap_cases = raw_data['usmap_cases'].copy()
+            usmap_cases = raw_data['usmap_cases']
             
             # **CRITICAL: Extract fresh state data BEFORE any processing**
             fresh_state_data = self.get_fresh_state_data(usmap_cases)
@@ -596,40 +821,46 @@ class DataManager:
             if 'year' in usmap_cases.columns:
                 usmap_cases = self.standardize_year_columns(usmap_cases, 'year')
             
-            # Merge map data
-            usmap = usmap_cases.merge(mmr_map, on='geography', how='left')
-            
             # Filter out NYC and DC as they are not states
-            usmap = usmap[~usmap['geography'].isin(['New York City', 'District of Columbia'])].copy()
+            usmap_cases = usmap_cases[~usmap_cases['geography'].isin(['New York City', 'District of Columbia'])]
             
-            # Handle year filtering - check both possible year columns
-            year_col = 'year_x' if 'year_x' in usmap.columns else 'year'
-            if year_col in usmap.columns:
-                # Convert year column to numeric
-                usmap[year_col] = pd.to_numeric(usmap[year_col], errors='coerce')
-                available_years = usmap[year_col].dropna().unique()
-                logging.info(f"Available years in merged data: {sorted(available_years)}")
+            # Filter to outbreak data (cumulative since 2025) before the merge so the join only sees those rows
+            if 'year' in usmap_cases.columns:
+                available_years = usmap_cases['year'].dropna().unique().tolist()
+                logging.info(f"Available years in case data: {sorted(available_years)}")
                 
-                # Filter to outbreak data (cumulative since 2025)
-                usmap_outbreak = usmap[usmap[year_col] >= self.OUTBREAK_START_YEAR].copy()
+                usmap_outbreak = usmap_cases[usmap_cases['year'] >= self.OUTBREAK_START_YEAR]
                 logging.info(f"After filtering to outbreak data ({self.OUTBREAK_START_YEAR}+): {len(usmap_outbreak)} rows")
                 
                 if len(usmap_outbreak) == 0:
                     logging.warning(f"No data found since outbreak start ({self.OUTBREAK_START_YEAR}). Checking for most recent year instead...")
-                    if len(usmap) > 0:
-                        most_recent_year = usmap[year_col].max()
+                    if len(usmap_cases) > 0:
+                        most_recent_year = usmap_cases['year'].max()
                         logging.info(f"Most recent year available: {most_recent_year}")
-                        usmap_outbreak = usmap[usmap[year_col] == most_recent_year].copy()
+                        usmap_outbreak = usmap_cases[usmap_cases['year'] == most_recent_year]
                         logging.info(f"Using {most_recent_year} data: {len(usmap_outbreak)} rows")
                 
-                usmap = usmap_outbreak
+                usmap_cases = usmap_outbreak
+            
+            # Merge map data on categorical keys so the join hashes integer codes
+            geography_dtype = pd.CategoricalDtype(
+                pd.concat([usmap_cases['geography'], mmr_map['geography']]).dropna().unique()
+            )
+            usmap = usmap_cases.astype({'geography': geography_dtype}).merge(
+                mmr_map.astype({'geography': geography_dtype}), on='geography', how='left'
+            )
+            # object, not str: on pandas < 3 astype(str) would turn missing keys into 'nan'
+            usmap['geography'] = usmap['geography'].astype(object)
+            
+            # The case data's year column picks up a suffix when both sides have one
+            year_col = 'year_x' if 'year_x' in usmap.columns else 'year'
             
             # Convert Estimate (%) to numeric and handle any string values
             if 'Estimate (%)' in usmap.columns:
                 usmap['Estimate (%)'] = pd.to_numeric(usmap['Estimate (%)'], errors='coerce')
             
             # Ensure cases column is numeric for calculations
-            cases_col = next((c for c in ['cases_calendar_year', 'cases', 'Cases'] if c in usmap.columns), None)
+            cases_col = find_column(usmap)
             if cases_col and cases_col in usmap.columns:
                 usmap[cases_col] = pd.to_numeric(usmap[cases_col], errors='coerce')
             
@@ -638,12 +869,15 @@ class DataManager:
                 # Sum cases by geography (state) across all years
                 cases_by_state = usmap.groupby('geography', as_index=False)[cases_col].sum()
                 
-                # Keep the most recent vaccination coverage data per state
-                vaccination_data = usmap.sort_values(year_col, ascending=False).drop_duplicates('geography', keep='first')
+                # Keep the most recent vaccination coverage row per state, even when its
+                # estimate is missing (groupby().first() would skip to an older year)
+                vaccination_data = usmap.sort_values(year_col, ascending=False).drop_duplicates(
+                    'geography', keep='first'
+                )[['geography', 'Estimate (%)']]
                 
                 # Merge aggregated cases with vaccination coverage
                 usmap = cases_by_state.merge(
-                    vaccination_data[['geography', 'Estimate (%)']],
+                    vaccination_data,
                     on='geography',
                     how='left'
                 )
@@ -683,18 +917,19 @@ class DataManager:
             
             # Process vaccine impact data
             logging.info("Processing vaccine impact data...")
-            vax_df = raw_data['vaccine_with'].copy()
-            no_vax_df = raw_data['vaccine_without'].copy()
+            vax_df = raw_data['vaccine_with']
+            no_vax_df = raw_data['vaccine_without']
             
-            # Ensure year columns are consistent
-            if 'year' in vax_df.columns:
-                vax_df = self.standardize_year_columns(vax_df, 'year')
-            if 'year' in no_vax_df.columns:
-                no_vax_df = self.standardize_year_columns(no_vax_df, 'year')
+            # Filter for USA data first - one array comparison per table, so the
+            # remaining steps only touch the USA rows
+            vax_usa = vax_df[vax_df['iso'].to_numpy() == 'USA'].copy()
+            no_vax_usa = no_vax_df[no_vax_df['iso'].to_numpy() == 'USA'].copy()
             
-            # Filter for USA data
-            vax_usa = vax_df[vax_df['iso'] == 'USA'].copy()
-            no_vax_usa = no_vax_df[no_vax_df['iso'] == 'USA'].copy()
+            # Ensure year columns are consistent
+            if 'year' in vax_usa.columns:
+                vax_usa = self.standardize_year_columns(vax_usa, 'year')
+            if 'year' in no_vax_usa.columns:
+                no_vax_usa = self.standardize_year_columns(no_vax_usa, 'year')
             
             # Merge vaccine data
             merged_vaccine = pd.merge(no_vax_usa, vax_usa, on='year', suffixes=('_no_vaccine', '_vaccine'))
@@ -708,12 +943,16 @@ class DataManager:
                 if col in merged_vaccine.columns:
                     merged_vaccine[col] = pd.to_numeric(merged_vaccine[col], errors='coerce')
             
-            merged_vaccine['lives_saved'] = (merged_vaccine['mean_deaths_no_vaccine'] - 
-                                           merged_vaccine['mean_deaths_vaccine'])
-            merged_vaccine['lives_saved_ub'] = (merged_vaccine['ub_deaths_no_vaccine'] - 
-                                              merged_vaccine['lb_deaths_vaccine'])
-            merged_vaccine['lives_saved_lb'] = (merged_vaccine['lb_deaths_no_vaccine'] - 
-                                              merged_vaccine['ub_deaths_vaccine'])
+            # Subtract on plain arrays - rows are already aligned by the merge, and
+            # pairing the columns lets all three estimates come from one subtraction
+            no_vaccine = merged_vaccine[['mean_deaths_no_vaccine', 'ub_deaths_no_vaccine', 'lb_deaths_no_vaccine']].to_numpy(dtype=np.float64)
+            vaccine = merged_vaccine[['mean_deaths_vaccine', 'lb_deaths_vaccine', 'ub_deaths_vaccine']].to_numpy(dtype=np.float64)
+            lives_saved = no_vaccine - vaccine
+            merged_vaccine = merged_vaccine.assign(
+                lives_saved=lives_saved[:, 0],
+                lives_saved_ub=lives_saved[:, 1],
+                lives_saved_lb=lives_saved[:, 2]
+            )
             merged_vaccine = merged_vaccine.sort_values('year')
             
             processed['vaccine_impact'] = merged_vaccine
@@ -765,29 +1004,12 @@ class DataManager:
                 continue
                 
             # Dataset-specific validation
-            if dataset_name == 'timeline':
-                required_cols = ['Year', 'Cases']
-                missing_cols = [col for col in required_cols if col not in df.columns]
-                if missing_cols:
-                    validation_results[dataset_name] = {
-                        'valid': False, 
-                        'error': f'Missing columns: {missing_cols}'
-                    }
-                else:
-                    validation_results[dataset_name] = {'valid': True, 'rows': len(df)}
-                    
-            elif dataset_name == 'usmeasles':
-                required_cols = ['year', 'cases']
-                missing_cols = [col for col in required_cols if col not in df.columns]
-                if missing_cols:
-                    validation_results[dataset_name] = {
-                        'valid': False, 
-                        'error': f'Missing columns: {missing_cols}'
-                    }
-                else:
-                    validation_results[dataset_name] = {'valid': True, 'rows': len(df)}
-                    
-            # Add more specific validation as needed
+            missing_cols = [col for col in self.REQUIRED_COLUMNS.get(dataset_name, []) if col not in df.columns]
+            if missing_cols:
+                validation_results[dataset_name] = {
+                    'valid': False, 
+                    'error': f'Missing columns: {missing_cols}'
+                }
             else:
                 validation_results[dataset_name] = {'valid': True, 'rows': len(df)}
                 
@@ -1,12 +1,29 @@
 import os
+import re
 import sys
+import gzip
+import hashlib
 import logging
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import pandas as pd
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+import chart_generators
+import chart_styles
+import table_generators
+from chart_styles import prepare_state_map
 from data_manager import DataManager
-from chart_generators import *
-from table_generators import *
+from chart_generators import (
+    create_measles_timeline, create_recent_trends, create_rnaught_comparison,
+    create_bivariate_choropleth, create_lives_saved_chart, create_southwest_weekly_comparison
+)
+from table_generators import (
+    create_timeline_table, create_recent_trends_table, create_rnaught_table,
+    create_state_map_table, create_lives_saved_table
+)
 
 # Configure logging
 logging.basicConfig(
@@ -18,94 +35,204 @@ logging.basicConfig(
     ]
 )
 
-def create_html_page(fig, filename):
+PLOTLY_BUNDLE = 'plotly.min.js'
+
+# Everything is written under docs/, which generate_visualizations creates once per run
+OUTPUT_DIR = Path('docs')
+
+# Render signatures live in a hidden directory, so Pages deployments leave them out
+SIGNATURE_DIR = OUTPUT_DIR / '.cache'
+
+# Serialize figures with orjson (NumPy-aware, implemented in C) when it is installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pio.json.config.default_engine = 'json'
+
+# Brotli siblings are written alongside gzip ones when the package is installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def write_atomic(path, content):
     """
-    Create a responsive HTML page for iframe embedding
-    Simple approach with CSS only
+    Write bytes to path via a sibling .tmp file and os.replace, so readers never see a partial file
     
     Args:
-        fig: Plotly figure object
-        filename (str): Output filename
+        path (Path): Destination file
+        content (bytes): Data to write
     """
-    # Generate the HTML with responsive config
-    html_content = fig.to_html(
-        include_plotlyjs='cdn',
-        div_id='chart',
-        config={'displayModeBar': False, 'responsive': True}
-    )
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def write_precompressed(path, content):
+    """
+    Write precompressed siblings of a static file for hosts that serve them directly
+    
+    gzip uses mtime=0 so unchanged content produces byte-identical files.
     
-    # Simple responsive wrapper
-    full_html = f"""<!DOCTYPE html>
+    Args:
+        path (Path): File the content was written to; siblings get .gz/.br appended
+        content (bytes): The file's contents
+    """
+    write_atomic(path.with_name(path.name + '.gz'), gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        write_atomic(path.with_name(path.name + '.br'), brotli.compress(content, quality=11))
+
+def write_plotly_bundle():
+    """
+    Write the plotly.js bundle to docs/ so every page can load the same local copy
+    
+    The file is only rewritten when its contents change (e.g. after a plotly
+    upgrade), so regular runs don't touch it.
+    """
+    bundle = get_plotlyjs().encode('utf-8')
+    bundle_path = OUTPUT_DIR / PLOTLY_BUNDLE
+    
+    if bundle_path.exists() and bundle_path.stat().st_size == len(bundle) and bundle_path.read_bytes() == bundle:
+        return
+    
+    write_atomic(bundle_path, bundle)
+    write_precompressed(bundle_path, bundle)
+    logging.info(f"Wrote {PLOTLY_BUNDLE} ({len(bundle)} bytes)")
+
+# Responsive page wrapper for iframe embedding. Everything except the figure JSON
+# is identical across pages, so it is encoded once at import time.
+_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Measles Data Visualization</title>
     <style>
-        body {{
+        body {
             margin: 0;
             padding: 0;
             background-color: white;
             font-family: Arial, sans-serif;
-        }}
+        }
         
-        #chart {{
+        #chart {
             width: 100%;
             height: 100vh;
-        }}
+        }
         
-        /* Scale down text on smaller screens */
-        @media screen and (max-width: 768px) {{
-            .plotly .xtick text,
-            .plotly .ytick text {{
-                font-size: 10px !important;
-            }}
+        /* Scale down text on smaller screens; narrower breakpoints only change the sizes */
+        @media screen and (max-width: 768px) {
+            :root {
+                --tick-fs: 10px;
+                --legend-fs: 10px;
+                --annotation-fs: 9px;
+            }
             
-            .plotly .legendtext {{
-                font-size: 10px !important;
-            }}
-            
-            .plotly .annotation-text {{
-                font-size: 9px !important;
-            }}
-        }}
-        
-        @media screen and (max-width: 480px) {{
             .plotly .xtick text,
-            .plotly .ytick text {{
-                font-size: 8px !important;
-            }}
+            .plotly .ytick text {
+                font-size: var(--tick-fs) !important;
+            }
             
-            .plotly .legendtext {{
-                font-size: 8px !important;
-            }}
+            .plotly .legendtext {
+                font-size: var(--legend-fs) !important;
+            }
             
-            .plotly .annotation-text {{
-                font-size: 7px !important;
-            }}
-        }}
+            .plotly .annotation-text {
+                font-size: var(--annotation-fs) !important;
+            }
+        }
+        
+        @media screen and (max-width: 480px) {
+            :root {
+                --tick-fs: 8px;
+                --legend-fs: 8px;
+                --annotation-fs: 7px;
+            }
+        }
     </style>
 </head>
 <body>
-    {html_content}
-    
-    <script>
-        // Simple resize handler
-        window.addEventListener('resize', function() {{
-            var gd = document.getElementById('chart');
-            if (gd && typeof Plotly !== 'undefined') {{
-                Plotly.Plots.resize(gd);
-            }}
-        }});
-    </script>
+    <script type="text/javascript">window.PlotlyConfig = {MathJaxConfig: 'local'};</script>
+    <script charset="utf-8" src="{plotly_bundle}"></script>
+    <div style="height:100%; width:100%;">
+        <div id="chart" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+        <script type="text/javascript">
+            window.PLOTLYENV = window.PLOTLYENV || {};
+            var fig = {fig_json};
+            var gd = document.getElementById("chart");
+            function plot() {
+                Plotly.newPlot(gd, fig.data, fig.layout, {displayModeBar: false, responsive: true});
+            }
+            /* Draw once the chart first scrolls into view, so offscreen iframes stay idle */
+            if (gd && 'IntersectionObserver' in window) {
+                var observer = new IntersectionObserver(function(entries) {
+                    if (entries[0].isIntersecting) {
+                        observer.disconnect();
+                        plot();
+                    }
+                });
+                observer.observe(gd);
+            } else if (gd) {
+                plot();
+            }
+        </script>
+    </div>
 </body>
 </html>"""
+
+def _compact_page(template):
+    """
+    Strip indentation, blank lines and whole-line comments from the page template,
+    and collapse whitespace inside its <style> block
+    
+    The template is a fixed constant, so this conservative pass is enough;
+    it never rewrites text inside a line outside of CSS.
+    """
+    lines = [line.strip() for line in template.splitlines()]
+    page = '\n'.join(
+        line for line in lines
+        if line and not line.startswith('//') and not (line.startswith('/*') and line.endswith('*/'))
+    )
+    return re.sub(
+        r'<style>(.*?)</style>',
+        lambda match: '<style>' + re.sub(r'\s*([{}:;,])\s*', r'\1', match.group(1)).replace(' !important', '!important') + '</style>',
+        page,
+        flags=re.DOTALL
+    )
+
+_PAGE_HEAD, _PAGE_TAIL = (
+    part.encode('utf-8')
+    for part in _compact_page(_PAGE_TEMPLATE).replace('{plotly_bundle}', PLOTLY_BUNDLE).split('{fig_json}')
+)
+
+def render_html_page(fig):
+    """
+    Render a responsive HTML page for iframe embedding
+    Simple approach with CSS only
     
-    output_dir = Path('docs')
-    output_dir.mkdir(exist_ok=True)
+    Args:
+        fig: Plotly figure object
+        
+    Returns:
+        bytes: Complete page, encoded as UTF-8
+    """
+    # Serialize the figure once and drop it between the prebuilt page halves
+    return b''.join([_PAGE_HEAD, fig.to_json().encode('utf-8'), _PAGE_TAIL])
+
+def create_html_page(fig, filename):
+    """
+    Create a responsive HTML page for iframe embedding
     
-    with open(output_dir / filename, 'w', encoding='utf-8') as f:
-        f.write(full_html)
+    Args:
+        fig: Plotly figure object
+        filename (str): Output filename
+    """
+    # Write the page in a single binary call, replacing any old copy atomically
+    write_atomic(OUTPUT_DIR / filename, render_html_page(fig))
     
     logging.info(f"Created {filename}")
     
@@ -116,7 +243,6 @@ def check_existing_visualizations():
     Returns:
         bool: True if all critical files exist, False otherwise
     """
-    output_dir = Path('docs')
     critical_files = [
         'timeline.html',
         'recent_trends.html',
@@ -125,10 +251,13 @@ def check_existing_visualizations():
         'lives_saved.html'
     ]
     
-    if not output_dir.exists():
+    if not OUTPUT_DIR.is_dir():
         return False
     
-    existing_files = [f for f in critical_files if (output_dir / f).exists()]
+    # One directory listing instead of a stat() per file
+    with os.scandir(OUTPUT_DIR) as entries:
+        names = {entry.name for entry in entries}
+    existing_files = [f for f in critical_files if f in names]
     
     if len(existing_files) == len(critical_files):
         logging.info(f"All {len(critical_files)} critical visualization files exist")
@@ -137,120 +266,269 @@ def check_existing_visualizations():
         logging.info(f"Only {len(existing_files)}/{len(critical_files)} critical files exist")
         return False
 
-def generate_visualizations(data):
+def render_chart(chart_func, *args, static=False):
     """
-    Generate all visualizations from data with per-chart fallback
+    Build a chart and serialize it to its output format
     
     Args:
-        data: Dictionary containing all datasets
+        chart_func: Function that builds the Plotly figure
+        *args: Arguments passed to chart_func
+        static (bool): Render a static SVG image (requires kaleido) instead of an interactive page
         
     Returns:
-        dict: Status of each visualization (True/False/'fallback' for success)
+        bytes: Rendered page or image
     """
-    status = {}
+    fig = chart_func(*args)
+    if static:
+        return fig.to_image(format='svg')
+    return render_html_page(fig)
+
+def save_chart(chart_name, content, static=False):
+    """
+    Write rendered chart output, replacing the existing file only once the write succeeded
     
-    # Create output directory
-    output_dir = Path('docs')
-    output_dir.mkdir(exist_ok=True)
+    Args:
+        chart_name (str): Output name, written to docs/<chart_name>.html (or .svg)
+        content (bytes): Rendered page or image from render_chart
+        static (bool): Whether the content is a static SVG image
+        
+    Returns:
+        bool: True on success
+    """
+    extension = 'svg' if static else 'html'
+    final_file = OUTPUT_DIR / f"{chart_name}.{extension}"
     
-    def safe_generate_chart(chart_name, chart_func, *args):
-        """Safely generate a chart with fallback to existing file"""
-        try:
-            fig = chart_func(*args)
-            temp_file = output_dir / f"{chart_name}_temp.html"
-            final_file = output_dir / f"{chart_name}.html"
-            
-            # Generate to temp location first
-            create_html_page(fig, f"{chart_name}_temp.html")
-            
-            # Only replace existing file if generation succeeded
-            temp_file.rename(final_file)
-            logging.info(f"Successfully generated {chart_name}.html")
-            return True
-        except Exception as e:
-            logging.error(f"Failed to create {chart_name}: {e}")
-            # Check if old version exists
-            if (output_dir / f"{chart_name}.html").exists():
-                logging.warning(f"Keeping existing {chart_name}.html")
-                return 'fallback'
-            else:
-                return False
+    write_atomic(final_file, content)
+    write_precompressed(final_file, content)
+    logging.info(f"Successfully generated {final_file.name}")
+    return True
+
+def _fallback_status(chart_name, error, static=False):
+    """
+    Log a chart failure and report whether an older file is being kept
     
-    # Generate charts
-    logging.info("Generating charts...")
+    Returns:
+        bool or str: 'fallback' if an older file exists, False otherwise
+    """
+    extension = 'svg' if static else 'html'
+    logging.error(f"Failed to create {chart_name}: {error}")
+    # Check if old version exists
+    if (OUTPUT_DIR / f"{chart_name}.{extension}").exists():
+        logging.warning(f"Keeping existing {chart_name}.{extension}")
+        return 'fallback'
+    return False
+
+def safe_generate_chart(chart_name, chart_func, *args, static=False):
+    """
+    Safely generate a chart with fallback to existing file
     
-    status['southwest_weekly'] = safe_generate_chart(
-        'southwest_weekly', 
-        create_southwest_weekly_comparison, 
-        data['weekly_comparison']
-    )
+    Args:
+        chart_name (str): Output name, written to docs/<chart_name>.html (or .svg)
+        chart_func: Function that builds the Plotly figure
+        *args: Arguments passed to chart_func
+        static (bool): Write a static SVG image (requires kaleido) instead of an interactive page
+        
+    Returns:
+        bool or str: True on success, 'fallback' if an older file was kept, False otherwise
+    """
+    try:
+        return save_chart(chart_name, render_chart(chart_func, *args, static=static), static)
+    except Exception as e:
+        return _fallback_status(chart_name, e, static)
+
+def _source_digest():
+    """
+    Hash the modules that shape rendered output, so code changes invalidate signatures
     
-    status['timeline'] = safe_generate_chart(
-        'timeline', 
-        create_measles_timeline, 
-        data['timeline']
-    )
+    Returns:
+        bytes: SHA-256 digest of the generator, style and page template sources
+    """
+    digest = hashlib.sha256()
+    for module in (chart_generators, table_generators, chart_styles, sys.modules[__name__]):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.digest()
+
+def _update_signature(digest, value):
+    """Feed a chart argument (DataFrame, dict of DataFrames, datetime, ...) into a hash"""
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes])).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value):
+            digest.update(repr(key).encode('utf-8'))
+            _update_signature(digest, value[key])
+    elif isinstance(value, datetime):
+        # The run timestamp feeds the "Last refreshed" footers and week labels; re-render
+        # once per calendar day so the footers follow the daily refresh
+        digest.update(value.date().isoformat().encode('utf-8'))
+    else:
+        digest.update(repr(value).encode('utf-8'))
+
+def chart_signature(chart_name, args, static, source_digest):
+    """
+    Compute a signature of everything a chart's output depends on
     
-    status['recent_trends'] = safe_generate_chart(
-        'recent_trends', 
-        create_recent_trends, 
-        data['usmeasles'], 
-        data.get('mmr', pd.DataFrame())
-    )
+    Args:
+        chart_name (str): Output name
+        args (tuple): Arguments passed to the chart function
+        static (bool): Whether the output is a static SVG image
+        source_digest (bytes): Digest from _source_digest()
+        
+    Returns:
+        str: Hex signature, stored in docs/.cache/<chart_name>.sig after a successful write
+    """
+    digest = hashlib.sha256(source_digest)
+    digest.update(f"{chart_name}:{static}".encode('utf-8'))
+    for arg in args:
+        _update_signature(digest, arg)
+    return digest.hexdigest()
+
+# Render tasks for the current process; set once per worker by the pool initializer
+_render_tasks = []
+
+def _init_render_worker(tasks):
+    """Store the (chart_func, args, static) tasks, so their DataFrames are pickled once per worker"""
+    global _render_tasks
+    _render_tasks = tasks
+
+def _render_chart_task(index):
+    """Render the task at index in _render_tasks"""
+    chart_func, args, static = _render_tasks[index]
+    return render_chart(chart_func, *args, static=static)
+
+def _render_pages(pending, static=False):
+    """
+    Render pages in worker processes, falling back to this process if the pool is unavailable
     
-    status['rnaught_comparison'] = safe_generate_chart(
-        'rnaught_comparison', 
-        create_rnaught_comparison
-    )
+    Args:
+        pending (list): (chart_name, chart_func, args) tasks
+        static (bool): Render static SVG images instead of interactive HTML pages
+        
+    Yields:
+        tuple: (chart_name, rendered bytes or the Exception raised), in completion order
+    """
+    tasks = [(chart_func, args, static) for _, chart_func, args in pending]
+    remaining = {index: task[0] for index, task in enumerate(pending)}
+    try:
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker, initargs=(tasks,)) as executor:
+            futures = {executor.submit(_render_chart_task, index): index for index in remaining}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    result = e
+                yield remaining.pop(index), result
+    except (OSError, BrokenProcessPool) as e:
+        logging.warning(f"Process pool unavailable ({e}), rendering {len(remaining)} pages serially")
+        _init_render_worker(tasks)
+        for index in list(remaining):
+            try:
+                result = _render_chart_task(index)
+            except Exception as e:
+                result = e
+            yield remaining.pop(index), result
+
+# Every page the site publishes: (output name, builder, argument extractor).
+# Extractors take (data, run_start) and return the builder's positional arguments.
+_PIPELINE = (
+    # Charts
+    ('southwest_weekly', create_southwest_weekly_comparison, lambda data, run_start: (data['weekly_comparison'], run_start)),
+    ('timeline', create_measles_timeline, lambda data, run_start: (data['timeline'], run_start)),
+    ('recent_trends', create_recent_trends, lambda data, run_start: (data['usmeasles'], data.get('mmr', pd.DataFrame()), run_start)),
+    ('rnaught_comparison', create_rnaught_comparison, lambda data, run_start: ()),
+    ('state_map', create_bivariate_choropleth, lambda data, run_start: (data['usmap'], run_start)),
+    ('lives_saved', create_lives_saved_chart, lambda data, run_start: (data.get('vaccine_impact', pd.DataFrame()), run_start)),
+    # Tables
+    ('timeline_table', create_timeline_table, lambda data, run_start: (data['timeline'], run_start)),
+    ('recent_trends_table', create_recent_trends_table, lambda data, run_start: (data['usmeasles'], data.get('mmr', pd.DataFrame()), run_start)),
+    ('rnaught_table', create_rnaught_table, lambda data, run_start: (run_start,)),
+    ('state_map_table', create_state_map_table, lambda data, run_start: (data['usmap'], run_start)),
+    ('lives_saved_table', create_lives_saved_table, lambda data, run_start: (data.get('vaccine_impact', pd.DataFrame()), run_start)),
+)
+
+def generate_visualizations(data, static=False):
+    """
+    Generate all visualizations from data with per-chart fallback
     
-    status['state_map'] = safe_generate_chart(
-        'state_map', 
-        create_bivariate_choropleth, 
-        data['usmap']
-    )
+    Charts are independent and CPU-bound (figure building and serialization),
+    so they are rendered in parallel worker processes.
     
-    status['lives_saved'] = safe_generate_chart(
-        'lives_saved', 
-        create_lives_saved_chart, 
-        data.get('vaccine_impact', pd.DataFrame())
-    )
+    Args:
+        data: Dictionary containing all datasets
+        static (bool): Write static SVG images instead of interactive HTML pages
+        
+    Returns:
+        dict: Status of each visualization (True/False/'fallback' for success)
+    """
+    # Create docs/ and its signature directory once; the writers below assume they exist
+    SIGNATURE_DIR.mkdir(parents=True, exist_ok=True)
+    if static:
+        logging.info("Static mode: writing SVG images instead of interactive HTML")
+    else:
+        write_plotly_bundle()
     
-    # Generate tables
-    logging.info("Generating tables...")
+    # One timestamp for the whole run, so every page shows the same refresh time
+    run_start = datetime.now()
     
-    status['timeline_table'] = safe_generate_chart(
-        'timeline_table', 
-        create_timeline_table, 
-        data['timeline']
-    )
+    # The state map and its table share per-state rates and classification; build them once
+    if 'usmap' in data:
+        data = {**data, 'usmap': prepare_state_map(data['usmap'])}
     
-    status['recent_trends_table'] = safe_generate_chart(
-        'recent_trends_table', 
-        create_recent_trends_table, 
-        data['usmeasles'], 
-        data.get('mmr', pd.DataFrame())
-    )
+    tasks = [(chart_name, builder, extract(data, run_start)) for chart_name, builder, extract in _PIPELINE]
     
-    status['rnaught_table'] = safe_generate_chart(
-        'rnaught_table', 
-        create_rnaught_table
-    )
+    # Skip pages whose inputs and generator code are unchanged since they were written
+    extension = 'svg' if static else 'html'
+    source_digest = _source_digest()
+    status = {}
+    signatures = {}
+    pending = []
+    for task in tasks:
+        chart_name, _, args = task
+        signature = chart_signature(chart_name, args, static, source_digest)
+        sig_file = SIGNATURE_DIR / f"{chart_name}.sig"
+        if (OUTPUT_DIR / f"{chart_name}.{extension}").exists() and sig_file.exists() and sig_file.read_text() == signature:
+            status[chart_name] = True
+            continue
+        signatures[chart_name] = signature
+        pending.append(task)
     
-    status['state_map_table'] = safe_generate_chart(
-        'state_map_table', 
-        create_state_map_table, 
-        data['usmap']
-    )
+    if status:
+        logging.info(f"Up to date, skipping {len(status)}: {', '.join(status)}")
+    if not pending:
+        return status
     
-    status['lives_saved_table'] = safe_generate_chart(
-        'lives_saved_table', 
-        create_lives_saved_table, 
-        data.get('vaccine_impact', pd.DataFrame())
-    )
+    logging.info(f"Generating {len(pending)} charts and tables...")
     
-    return status
+    # Workers render pages to bytes; this process writes each one on an I/O thread
+    # as soon as it arrives, so disk writes overlap with the charts still rendering
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        writes = {}
+        for chart_name, result in _render_pages(pending, static):
+            if isinstance(result, Exception):
+                status[chart_name] = _fallback_status(chart_name, result, static)
+            else:
+                writes[chart_name] = io_pool.submit(save_chart, chart_name, result, static)
+        
+        for chart_name, future in writes.items():
+            try:
+                status[chart_name] = future.result()
+            except Exception as e:
+                status[chart_name] = _fallback_status(chart_name, e, static)
+            if status[chart_name] is True:
+                write_atomic(SIGNATURE_DIR / f"{chart_name}.sig", signatures[chart_name].encode('utf-8'))
+    
+    return {task[0]: status[task[0]] for task in tasks}
+
 def main():
-    """Main application function with improved fallback handling"""
+    """
+    Main application function with improved fallback handling
+    
+    Pass --static to write SVG images (via kaleido) instead of interactive HTML pages.
+    """
     logging.info("Starting Measles Data Visualization Generator")
     
     try:
@@ -277,12 +555,14 @@ def main():
         
         # Validate data
         validation_results = data_manager.validate_data(data)
-        logging.info("Data validation results:")
-        for dataset, result in validation_results.items():
-            if result['valid']:
-                logging.info(f"  {dataset}: Valid ({result.get('rows', 0)} rows)")
-            else:
-                logging.warning(f"  {dataset}: Invalid - {result['error']}")
+        result_lines = [
+            f"  {dataset}: Valid ({result.get('rows', 0)} rows)" if result['valid']
+            else f"  {dataset}: Invalid - {result['error']}"
+            for dataset, result in validation_results.items()
+        ]
+        all_valid = all(result['valid'] for result in validation_results.values())
+        logging.log(logging.INFO if all_valid else logging.WARNING,
+                    "Data validation results:\n" + "\n".join(result_lines))
         
         # Check if any critical datasets failed validation
         critical_datasets = ['timeline', 'usmeasles', 'usmap']
@@ -301,7 +581,7 @@ def main():
                 sys.exit(1)
         
         # Generate all visualizations
-        status = generate_visualizations(data)
+        status = generate_visualizations(data, static='--static' in sys.argv[1:])
         
         # Log results
         successful = sum(1 for v in status.values() if v)